@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Optional
 from langchain_openai import AzureChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.agents import create_openai_tools_agent, AgentExecutor
@@ -54,23 +57,55 @@ answer questions related to Premier League football."
 
 
 class PremierLeagueAgent:
+    # Compiled chat prompts shared across instances, keyed by mode
+    _prompt_cache: dict = {}
+
+    # Maximum number of answers kept in the exact-match query cache
+    QUERY_CACHE_MAXSIZE = 512
+    # Minimum similarity for a cached question to count as a paraphrase
+    QUERY_CACHE_SIMILARITY_THRESHOLD = 0.92
+
     def __init__(self, llm: AzureChatOpenAI, tools: FootballTools, mode: str = "strict", verbose: bool = False):
         self.llm = llm
         self.tools = tools
         self.agent_executor = None
         self.mode = mode
         self.verbose = verbose
-        self._init()
-
-    def _init(self):
-        try:
-            tools = self.tools.get_tools()
-
+        self._query_cache: OrderedDict = OrderedDict()
+        self._system_prompt: Optional[str] = None
+        self._initialized = False
+
+    def _ensure_init(self):
+        """Build the executor on first use so construction stays cheap.
+
+        Deferring the LangChain/Azure setup keeps imports and start-up
+        fast; cached answers never need the executor at all.
+        """
+        if self.agent_executor is None and not self._initialized:
+            self._initialized = True
+            self._init()
+
+    def _compiled_prompt(self) -> ChatPromptTemplate:
+        """Return the chat prompt for this mode, compiling it at most once.
+
+        The prompt only depends on the mode, so all agents share the
+        compiled template instead of re-parsing it per instance.
+        """
+        prompt = PremierLeagueAgent._prompt_cache.get(self.mode)
+        if prompt is None:
             prompt = ChatPromptTemplate.from_messages([
                 ("system", self._get_system_prompt()),
                 ("user", "{input}"),
                 MessagesPlaceholder(variable_name="agent_scratchpad")
             ])
+            PremierLeagueAgent._prompt_cache[self.mode] = prompt
+        return prompt
+
+    def _init(self):
+        try:
+            tools = self.tools.get_tools()
+
+            prompt = self._compiled_prompt()
 
             agent = create_openai_tools_agent(self.llm, tools, prompt)
             self.agent_executor = AgentExecutor(
@@ -86,24 +121,120 @@ class PremierLeagueAgent:
             raise
 
     def _get_system_prompt(self) -> str:
-        parts = [
-            prompt_parts["role"],
-            prompt_parts["core_rules"],
-            prompt_parts["available_info"],
-            prompt_parts["formatting"],
-            prompt_parts["invalid_queries"]
-        ]
-        if self.mode == "extended":
-            parts.insert(2, prompt_parts["extended_rules"])
-        return "\n\n".join(parts)
+        if self._system_prompt is None:
+            parts = [
+                prompt_parts["role"],
+                prompt_parts["core_rules"],
+                prompt_parts["available_info"],
+                prompt_parts["formatting"],
+                prompt_parts["invalid_queries"]
+            ]
+            if self.mode == "extended":
+                parts.insert(2, prompt_parts["extended_rules"])
+            self._system_prompt = "\n\n".join(parts)
+        return self._system_prompt
+
+    def _cache_key(self, question) -> Optional[str]:
+        """Normalize a question into a cache key, or None if not cacheable."""
+        if not isinstance(question, str):
+            return None
+        key = question.strip().lower()
+        return key or None
+
+    def _cache_lookup(self, key: Optional[str]) -> Optional[str]:
+        """Return a cached answer for the key, refreshing its LRU position.
+
+        Falls back to a fuzzy scan over cached questions so that close
+        paraphrases ("Who is Harry Kane" vs "Who is Harry Kane?") reuse
+        the same answer instead of re-running the LLM and tools.
+        """
+        if key is None:
+            return None
+
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+            logger.debug(f"Query cache hit for '{key}'")
+            return self._query_cache[key]
+
+        best_key = None
+        best_score = 0
+        for cached_key in self._query_cache:
+            score = SequenceMatcher(None, key, cached_key).ratio()
+            if score > best_score and score >= self.QUERY_CACHE_SIMILARITY_THRESHOLD:
+                best_key = cached_key
+                best_score = score
+
+        if best_key is None:
+            return None
+
+        logger.debug(
+            f"Query cache fuzzy hit for '{key}' via '{best_key}' ({best_score:.2f})")
+        answer = self._query_cache[best_key]
+        # Promote the paraphrase so future repeats are exact hits
+        self._cache_store(key, answer)
+        return answer
+
+    def _cache_store(self, key: Optional[str], answer: str):
+        """Store an answer in the LRU cache, evicting the oldest entry if full."""
+        if key is None:
+            return
+        self._query_cache[key] = answer
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.QUERY_CACHE_MAXSIZE:
+            self._query_cache.popitem(last=False)
 
     def query(self, question: str) -> str:
+        cache_key = self._cache_key(question)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        self._ensure_init()
         if not self.agent_executor:
             return "Agent is not properly initialized."
 
         try:
             response = self.agent_executor.invoke({"input": question})
-            return response.get('output', 'No response generated.')
+            if 'output' not in response:
+                # Not cached, matching query_stream: a transient empty
+                # response shouldn't pin the fallback for this question
+                return 'No response generated.'
+            answer = response['output']
+            self._cache_store(cache_key, answer)
+            return answer
         except Exception as e:
             logger.error(f"Error processing query '{question}': {e}")
             return f"I encountered an error while processing your question: {str(e)}"
+
+    def query_stream(self, question: str):
+        """Process a query, yielding answer chunks as they are generated.
+
+        Streams the underlying agent executor so callers can render output
+        as it arrives instead of waiting for the full completion. Only
+        final-answer chunks (those carrying an 'output' key) are yielded;
+        intermediate tool-call steps are skipped.
+        """
+        cache_key = self._cache_key(question)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        self._ensure_init()
+        if not self.agent_executor:
+            yield "Agent is not properly initialized."
+            return
+
+        try:
+            output_parts = []
+            for chunk in self.agent_executor.stream({"input": question}):
+                if 'output' in chunk:
+                    output_parts.append(chunk['output'])
+                    yield chunk['output']
+            if not output_parts:
+                yield 'No response generated.'
+            else:
+                self._cache_store(cache_key, ''.join(output_parts))
+        except Exception as e:
+            logger.error(f"Error processing query '{question}': {e}")
+            yield f"I encountered an error while processing your question: {str(e)}"
@@ -15,6 +15,8 @@ class AzureConfig:
     deployment: str
     subscription_key: str
     api_version: str
+    fast_model_name: str = "gpt-5-nano"
+    fast_deployment: str = "gpt-5-nano"
 
 
 @dataclass
@@ -29,7 +31,9 @@ class AppConfig:
     azure: AzureConfig
     football_api: FootballAPIConfig
     cache_ttl_hours: int = 24
-    max_completion_tokens: int = 2048
+    cache_dir: str = ""
+    max_completion_tokens: int = 1024
+    max_completion_tokens_extended: int = 2048
 
 
 def load_config() -> AppConfig:
@@ -39,7 +43,9 @@ def load_config() -> AppConfig:
         model_name=os.getenv("AZURE_MODEL_NAME", "gpt-5-mini"),
         deployment=os.getenv("AZURE_DEPLOYMENT", "gpt-5-mini"),
         subscription_key=os.getenv("AZURE_OPENAI_API_KEY", ""),
-        api_version=os.getenv("OPENAI_API_VERSION", "2024-12-01-preview")
+        api_version=os.getenv("OPENAI_API_VERSION", "2024-12-01-preview"),
+        fast_model_name=os.getenv("AZURE_FAST_MODEL_NAME", "gpt-5-nano"),
+        fast_deployment=os.getenv("AZURE_FAST_DEPLOYMENT", "gpt-5-nano")
     )
 
     football_config = FootballAPIConfig(
@@ -52,5 +58,9 @@ def load_config() -> AppConfig:
         azure=azure_config,
         football_api=football_config,
         cache_ttl_hours=int(os.getenv("CACHE_TTL_HOURS", "24")),
-        max_completion_tokens=int(os.getenv("MAX_COMPLETION_TOKENS", "2048"))
+        cache_dir=os.path.expanduser(
+            os.getenv("CACHE_DIR", "~/.cache/premier-nlp")),
+        max_completion_tokens=int(os.getenv("MAX_COMPLETION_TOKENS", "1024")),
+        max_completion_tokens_extended=int(
+            os.getenv("MAX_COMPLETION_TOKENS_EXTENDED", "2048"))
     )
@@ -1,9 +1,14 @@
+import re
 from datetime import date
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 
+# Shape check for API birth dates; rejecting malformed strings here is far
+# cheaper than raising and unwinding ValueError in date.fromisoformat.
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Player:
     id: int
     name: str
@@ -23,14 +28,38 @@ class Player:
             age=cls.calculate_age(data.get('dateOfBirth'))
         )
 
+    @classmethod
+    def from_api_list(cls, data_list: List[Dict[str, Any]]) -> List['Player']:
+        """Create players in bulk, resolving today's date once for age math."""
+        today = date.today()
+        return [
+            cls(
+                id=data.get('id', 0),
+                name=data.get('name', ''),
+                position=data.get('position'),
+                nationality=data.get('nationality'),
+                date_of_birth=data.get('dateOfBirth'),
+                age=cls._age_on(data.get('dateOfBirth'), today)
+            )
+            for data in data_list
+        ]
+
     @staticmethod
     def calculate_age(date_of_birth: Optional[str]) -> Optional[int]:
         if not date_of_birth:
             return None
+        return Player._age_on(date_of_birth, date.today())
+
+    @staticmethod
+    def _age_on(date_of_birth: Optional[str], today: date) -> Optional[int]:
+        """Calculate the age on a given day, or None if the date is unusable."""
+        if not date_of_birth or not _ISO_DATE_RE.fullmatch(date_of_birth):
+            return None
 
         try:
+            # The try/except stays as a backstop for strings that look right
+            # but hold impossible values (e.g. month 13)
             birth_date = date.fromisoformat(date_of_birth)
-            today = date.today()
             age = today.year - birth_date.year - \
                 ((today.month, today.day) < (birth_date.month, birth_date.day))
             return age if age >= 0 else None
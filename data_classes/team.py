@@ -3,7 +3,7 @@ from typing import List, Optional, Dict, Any
 from data_classes.player import Player
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     id: int
     name: str
@@ -21,8 +21,7 @@ class Team:
     @classmethod
     def from_api_data(cls, data: Dict[str, Any]) -> 'Team':
         squad_data = data.get('squad', [])
-        squad = [Player.from_api_data(player_data)
-                 for player_data in squad_data] if squad_data else []
+        squad = Player.from_api_list(squad_data) if squad_data else []
 
         return cls(
             id=data.get('id', 0),
@@ -8,6 +8,8 @@ from tools.football_tools import FootballTools
 from services.football_api_service import FootballAPIService
 from services.search_service import SearchService
 from langchain_openai import AzureChatOpenAI
+from prompt_toolkit import PromptSession
+from prompt_toolkit.patch_stdout import patch_stdout
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,11 @@ def parse_arguments():
         action='store_true',
         help='Show timing information for queries'
     )
+    parser.add_argument(
+        '-f', '--fast',
+        action='store_true',
+        help='Use the smaller, faster Azure deployment for lower latency'
+    )
     parser.add_argument(
         '-m', '--mode',
         choices=['strict', 'extended'],
@@ -47,13 +54,26 @@ def setup_logging(verbose=False):
     )
 
 
-def init_agent(config, mode: str = "strict", verbose: bool = False) -> PremierLeagueAgent:
+def init_agent(config, mode: str = "strict", verbose: bool = False,
+               fast: bool = False) -> PremierLeagueAgent:
+    # The queries this agent answers are simple tool-selection + formatting
+    # tasks, so the smaller deployment is usually enough; the full model
+    # stays the default for quality.
+    deployment = config.azure.fast_deployment if fast else config.azure.deployment
+    model_name = config.azure.fast_model_name if fast else config.azure.model_name
+    # Extended mode is allowed to elaborate, so it gets the larger budget;
+    # strict mode answers are short and a lower cap trims generation time.
+    max_completion_tokens = (config.max_completion_tokens_extended
+                             if mode == "extended"
+                             else config.max_completion_tokens)
     llm = AzureChatOpenAI(
-        azure_deployment=config.azure.deployment,
-        model_name=config.azure.model_name,
-        max_completion_tokens=config.max_completion_tokens,
+        azure_deployment=deployment,
+        model_name=model_name,
+        max_completion_tokens=max_completion_tokens,
+        streaming=True,
     )
-    api_service = FootballAPIService(config.football_api)
+    api_service = FootballAPIService(
+        config.football_api, cache_dir=config.cache_dir)
     search_service = SearchService(api_service)
     tools = FootballTools(search_service)
     agent = PremierLeagueAgent(llm, tools, mode, verbose)
@@ -80,7 +100,8 @@ def main():
 
         logger.info("Initializing Premier League agent...")
 
-        agent = init_agent(config)
+        agent = init_agent(config, mode=args.mode, verbose=args.verbose,
+                           fast=args.fast)
 
         print("\n🏆 Premier League Info Agent is ready!")
         print("Ask me about Premier League teams, players, or positions.")
@@ -88,12 +109,19 @@ def main():
             print("📝 Verbose logging enabled")
         if args.timing:
             print("⏱️  Timing information enabled")
+        if args.fast:
+            print("⚡ Fast model deployment enabled")
         print("Type 'exit' to quit.\n")
 
+        # prompt_toolkit keeps the input line responsive while streamed
+        # tokens are being rendered above it
+        prompt_session = PromptSession()
+
         # Main interaction loop
         while True:
             try:
-                query = input("❓ Your question: ").strip()
+                with patch_stdout():
+                    query = prompt_session.prompt("❓ Your question: ").strip()
 
                 if query.lower() in ['exit', 'quit', 'q']:
                     print("👋 Goodbye!")
@@ -108,14 +136,16 @@ def main():
                 if args.timing:
                     start_time = time.time()
 
-                response = agent.query(query)
+                print("\n✅ ", end="", flush=True)
+                for chunk in agent.query_stream(query):
+                    print(chunk, end="", flush=True)
+                print("\n")
 
                 if args.timing:
                     end_time = time.time()
                     duration = end_time - start_time
-                    print(f"\n⏱️  Query processed in {duration:.2f} seconds")
+                    print(f"⏱️  Query processed in {duration:.2f} seconds")
 
-                print(f"\n✅ {response}\n")
                 print("-" * 80)
 
             except KeyboardInterrupt:
@@ -1,5 +1,7 @@
 import requests
 import json
+import orjson
+import os
 import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -16,11 +18,57 @@ class FootballAPIError(Exception):
 
 
 class FootballAPIService:
-    def __init__(self, config: FootballAPIConfig):
+    def __init__(self, config: FootballAPIConfig, cache_dir: Optional[str] = None):
         self.config = config
         self.headers = {"X-Auth-Token": config.api_key}
+        self.cache_dir = cache_dir
+        # Reuse one session so requests share a pooled keep-alive connection
+        # (and requests' default gzip Accept-Encoding) instead of paying the
+        # TCP/TLS handshake on every call.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self._teams_cache: Optional[List[Team]] = None
         self._cache_timestamp: Optional[datetime] = None
+        # Conditional-request state: last seen ETag and parsed payload per URL
+        self._etags: Dict[str, str] = {}
+        self._payload_cache: Dict[str, Dict[str, Any]] = {}
+
+    def _disk_cache_path(self) -> str:
+        return os.path.join(
+            self.cache_dir, f"teams_{self.config.competition_code}.json")
+
+    def _load_cache_from_disk(self) -> bool:
+        """Restore the teams cache from disk, if persistence is enabled."""
+        if not self.cache_dir:
+            return False
+
+        try:
+            with open(self._disk_cache_path(), "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            timestamp = datetime.fromisoformat(payload["timestamp"])
+            teams = [Team.from_api_data(team_data)
+                     for team_data in payload["teams"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"No usable disk cache: {e}")
+            return False
+
+        self._teams_cache = teams
+        self._cache_timestamp = timestamp
+        logger.debug(f"Restored {len(teams)} teams from disk cache")
+        return True
+
+    def _save_cache_to_disk(self, teams_data: List[Dict[str, Any]], timestamp: datetime):
+        """Persist the raw teams payload so restarts skip the initial fetch."""
+        if not self.cache_dir:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._disk_cache_path(), "w", encoding="utf-8") as f:
+                json.dump({"timestamp": timestamp.isoformat(),
+                           "teams": teams_data}, f)
+        except OSError as e:
+            logger.warning(f"Failed to write teams disk cache: {e}")
 
     def _is_cache_valid(self, ttl_hours: int = 24) -> bool:
         """Check if the cache is still valid."""
@@ -44,9 +92,28 @@ class FootballAPIService:
                         f"Retrying request in {wait_time}s (attempt {attempt + 1}/{max_retries + 1})")
                     time.sleep(wait_time)
 
-                response = requests.get(url, headers=self.headers, timeout=10)
+                etag = self._etags.get(url)
+                if etag and url in self._payload_cache:
+                    response = self.session.get(
+                        url, headers={"If-None-Match": etag}, timeout=10)
+                else:
+                    response = self.session.get(url, timeout=10)
+
+                if response.status_code == 304:
+                    logger.debug(
+                        f"Server reports {url} unchanged, reusing parsed payload")
+                    return self._payload_cache[url]
+
                 response.raise_for_status()
-                return response.json()
+                # orjson parses the raw bytes considerably faster than the
+                # stdlib decoder behind response.json()
+                data = orjson.loads(response.content)
+
+                new_etag = response.headers.get("ETag")
+                if new_etag:
+                    self._etags[url] = new_etag
+                    self._payload_cache[url] = data
+                return data
 
             except requests.exceptions.RequestException as e:
                 last_exception = e
@@ -79,9 +146,13 @@ class FootballAPIService:
 
     def get_teams(self, use_cache: bool = True, cache_ttl_hours: int = 24) -> List[Team]:
         """Get all teams for the competition."""
-        if use_cache and self._teams_cache and self._is_cache_valid(cache_ttl_hours):
-            logger.debug("Using cached teams data")
-            return self._teams_cache
+        if use_cache:
+            if not self._teams_cache:
+                # A previous run may have left a usable cache on disk
+                self._load_cache_from_disk()
+            if self._teams_cache and self._is_cache_valid(cache_ttl_hours):
+                logger.debug("Using cached teams data")
+                return self._teams_cache
 
         logger.debug("Fetching teams data from API")
         endpoint = f"competitions/{self.config.competition_code}/teams"
@@ -94,6 +165,7 @@ class FootballAPIService:
             # Cache the results
             self._teams_cache = teams
             self._cache_timestamp = datetime.now()
+            self._save_cache_to_disk(teams_data, self._cache_timestamp)
 
             logger.debug(f"Successfully loaded {len(teams)} teams")
             return teams
@@ -1,69 +1,192 @@
+import sys
+from collections import OrderedDict
 from typing import List, Optional, Tuple
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
 from data_classes.team import Team
 from data_classes.player import Player
 
 
 class SearchService:
+    # Upper bound on memoized fuzzy lookups per index generation
+    RESULT_CACHE_MAXSIZE = 256
+
     def __init__(self, team_data_store):
         self.teams_data_store = team_data_store
+        self._indexed_teams = None
+        self._position_index = {}
+        self._team_index_teams = None
+        self._team_candidates = []
+        self._team_candidate_owners = []
+        self._team_exact = {}
+        self._player_index_teams = None
+        self._player_candidates = []
+        self._player_candidate_owners = []
+        self._player_exact = {}
+        # Fuzzy results memoized per (normalized query, threshold); both
+        # caches are dropped whenever their index is rebuilt.
+        self._team_result_cache = OrderedDict()
+        self._player_result_cache = OrderedDict()
+
+    def _get_team_index(self, teams) -> Tuple[List[str], List[Team]]:
+        """Flatten team name/short name/TLA into parallel candidate arrays.
+
+        The lowercased strings and their owning teams are rebuilt only
+        when the data store hands out a new teams list, so each lookup
+        runs one batched scorer pass instead of a Python loop with
+        per-field lowercasing.
+        """
+        if teams is not self._team_index_teams:
+            candidates = []
+            owners = []
+            for team in teams:
+                for value in (team.name, team.short_name, team.tla):
+                    if value:
+                        # Interned so exact-probe and memo-key comparisons
+                        # hit pointer equality before char-by-char compare
+                        candidates.append(sys.intern(value.lower()))
+                        owners.append(team)
+            self._team_candidates = candidates
+            self._team_candidate_owners = owners
+            # Exact lookups resolve in one hash probe; first owner wins,
+            # matching the first-best tie behaviour of the fuzzy scan.
+            exact = {}
+            for candidate, owner in zip(candidates, owners):
+                exact.setdefault(candidate, owner)
+            self._team_exact = exact
+            self._team_result_cache.clear()
+            self._team_index_teams = teams
+        return self._team_candidates, self._team_candidate_owners
+
+    def _get_position_index(self, teams) -> dict:
+        """Group each team's squad by lowercased position.
+
+        The index is rebuilt whenever the data store hands out a new teams
+        list (i.e. after a cache refresh), so position lookups scan the
+        handful of distinct positions instead of the whole squad.
+        """
+        if teams is not self._indexed_teams:
+            index = {}
+            for team in teams:
+                by_position = {}
+                for player in team.squad:
+                    if player.position:
+                        by_position.setdefault(
+                            player.position.lower(), []).append(player)
+                index[id(team)] = by_position
+            self._indexed_teams = teams
+            self._position_index = index
+        return self._position_index
+
+    def _memoize(self, cache: OrderedDict, key, result):
+        """Record a fuzzy lookup result, evicting the oldest entry when full."""
+        cache[key] = result
+        if len(cache) > self.RESULT_CACHE_MAXSIZE:
+            cache.popitem(last=False)
 
     def _calculate_similarity(self, a: str, b: str) -> float:
         """Calculate similarity between two strings."""
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        # rapidfuzz computes the same normalized Indel similarity as
+        # difflib's ratio(), but in C and without the junk heuristics
+        return fuzz.ratio(a.lower(), b.lower()) / 100.0
+
+    def current_teams(self) -> List[Team]:
+        """Return the teams list the data store currently serves.
+
+        Callers that cache derived results can compare this list by
+        identity to notice a refresh, the same way the indexes here do.
+        """
+        return self.teams_data_store.get_teams()
 
     def find_team(self, team_name: str, threshold: float = 0.6) -> Optional[Team]:
         """Find a team by name with fuzzy matching."""
-        best_match = None
-        best_score = 0
-
-        for team in self.teams_data_store.get_teams():
-            # Check full name
-            score = self._calculate_similarity(team_name, team.name)
-            if score > best_score and score >= threshold:
-                best_match = team
-                best_score = score
-
-            # Check short name if available
-            if team.short_name:
-                score = self._calculate_similarity(team_name, team.short_name)
-                if score > best_score and score >= threshold:
-                    best_match = team
-                    best_score = score
-
-            # Check TLA if available
-            if team.tla:
-                score = self._calculate_similarity(team_name, team.tla)
-                if score > best_score and score >= threshold:
-                    best_match = team
-                    best_score = score
-
-        return best_match
+        return self._find_team(
+            self.teams_data_store.get_teams(), team_name, threshold)
+
+    def _find_team(self, teams, team_name: str, threshold: float) -> Optional[Team]:
+        """Resolve a team against an already fetched teams list."""
+        candidates, owners = self._get_team_index(teams)
+        if not candidates:
+            return None
+
+        query = team_name.lower()
+        exact = self._team_exact.get(query)
+        if exact is not None:
+            return exact
+
+        cache_key = (query, threshold)
+        if cache_key in self._team_result_cache:
+            self._team_result_cache.move_to_end(cache_key)
+            return self._team_result_cache[cache_key]
+
+        match = process.extractOne(
+            query, candidates,
+            scorer=fuzz.ratio, score_cutoff=threshold * 100)
+        result = None if match is None else owners[match[2]]
+        self._memoize(self._team_result_cache, cache_key, result)
+        return result
+
+    def _get_player_index(self, teams) -> Tuple[List[str], List[Tuple[Player, Team]]]:
+        """Flatten all squads into parallel candidate arrays.
+
+        Lowercased player names and their (player, team) owners are
+        cached per teams list so the per-call string normalization from
+        the old nested loop happens once per cache refresh.
+        """
+        if teams is not self._player_index_teams:
+            candidates = []
+            owners = []
+            for team in teams:
+                for player in team.squad:
+                    if player.name:
+                        candidates.append(sys.intern(player.name.lower()))
+                        owners.append((player, team))
+            self._player_candidates = candidates
+            self._player_candidate_owners = owners
+            # Same one-probe exact lookup as the team index
+            exact = {}
+            for candidate, owner in zip(candidates, owners):
+                exact.setdefault(candidate, owner)
+            self._player_exact = exact
+            self._player_result_cache.clear()
+            self._player_index_teams = teams
+        return self._player_candidates, self._player_candidate_owners
 
     def find_player(self, player_name: str, threshold: float = 0.7) -> Optional[Tuple[Player, Team]]:
         """Find a player by name with fuzzy matching."""
-        best_match = None
-        best_team = None
-        best_score = 0
+        candidates, owners = self._get_player_index(
+            self.teams_data_store.get_teams())
+        if not candidates:
+            return None
 
-        for team in self.teams_data_store.get_teams():
-            for player in team.squad:
-                score = self._calculate_similarity(player_name, player.name)
-                if score > best_score and score >= threshold:
-                    best_match = player
-                    best_team = team
-                    best_score = score
+        query = player_name.lower()
+        exact = self._player_exact.get(query)
+        if exact is not None:
+            return exact
 
-        return (best_match, best_team) if best_match else None
+        cache_key = (query, threshold)
+        if cache_key in self._player_result_cache:
+            self._player_result_cache.move_to_end(cache_key)
+            return self._player_result_cache[cache_key]
+
+        match = process.extractOne(
+            query, candidates,
+            scorer=fuzz.ratio, score_cutoff=threshold * 100)
+        result = None if match is None else owners[match[2]]
+        self._memoize(self._player_result_cache, cache_key, result)
+        return result
 
     def find_players_by_team_and_position(self, team_name: str, position: str) -> List[Player]:
         """Find all players by position."""
-        results = []
-        team = self.find_team(team_name)
+        teams = self.teams_data_store.get_teams()
+        team = self._find_team(teams, team_name, 0.6)
         if team is None:
             return []
 
-        for player in team.squad:
-            if player.position and position.lower() in player.position.lower():
-                results.append(player)
+        index = self._get_position_index(teams)
+        position_lower = position.lower()
+
+        results = []
+        for team_position, players in index.get(id(team), {}).items():
+            if position_lower in team_position:
+                results.extend(players)
         return results
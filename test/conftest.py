@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the test suite.
+
+The spec'd mock prototypes live here so every test file reuses one
+introspection pass per class instead of rebuilding Mock(spec=...)
+objects per test.
+"""
+
+import copy
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from data_classes.player import Player
+from tools.football_tools import FootballTools
+from langchain_openai import AzureChatOpenAI
+
+_LLM_PROTOTYPE = Mock(spec=AzureChatOpenAI)
+_FOOTBALL_TOOLS_PROTOTYPE = Mock(spec=FootballTools)
+_PLAYER_MOCK_TEMPLATE = Mock(spec=Player)
+
+# Only .name/.description are ever read from the tool stand-ins, so plain
+# namespaces beat spec'd Mocks of langchain's Tool class.
+_TOOL_PROTOTYPES = [
+    SimpleNamespace(name="Player_Info",
+                    description="Get player information"),
+    SimpleNamespace(name="Team_Info",
+                    description="Get team information"),
+    SimpleNamespace(name="Players_By_Team_And_Position",
+                    description="Get players by team and position"),
+]
+
+
+@pytest.fixture
+def mock_llm():
+    """Return the shared AzureChatOpenAI mock, reset for this test."""
+    _LLM_PROTOTYPE.reset_mock(return_value=True, side_effect=True)
+    return _LLM_PROTOTYPE
+
+
+@pytest.fixture
+def mock_football_tools():
+    """Return the shared FootballTools mock, reset for this test."""
+    _FOOTBALL_TOOLS_PROTOTYPE.reset_mock(return_value=True, side_effect=True)
+    _FOOTBALL_TOOLS_PROTOTYPE.get_tools.return_value = list(_TOOL_PROTOTYPES)
+    return _FOOTBALL_TOOLS_PROTOTYPE
+
+
+@pytest.fixture
+def make_player_mock():
+    """Return a factory for spec'd Player mocks.
+
+    Copying the module-level template skips the spec introspection
+    Mock(spec=Player) would repeat on every call.
+    """
+    return lambda: copy.copy(_PLAYER_MOCK_TEMPLATE)
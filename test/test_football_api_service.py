@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import requests
 import json
+import os
 
 from services.football_api_service import FootballAPIService, FootballAPIError
 from data_classes.team import Team
@@ -89,6 +90,12 @@ class TestFootballAPIServiceInitialization:
         assert service._teams_cache is None
         assert service._cache_timestamp is None
 
+    def test_session_reused_with_auth_headers(self, mock_config):
+        """Test that one session is created and carries the auth header."""
+        service = FootballAPIService(mock_config)
+        assert isinstance(service.session, requests.Session)
+        assert service.session.headers["X-Auth-Token"] == "test_api_key"
+
     def test_headers_created_correctly(self, mock_config):
         """Test that headers are created with the API key."""
         service = FootballAPIService(mock_config)
@@ -123,12 +130,12 @@ class TestCacheManagement:
 class TestMakeRequest:
     """Test the _make_request private method."""
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_success(self, mock_get, api_service):
         """Test successful API request."""
         # Setup mock response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -136,50 +143,38 @@ class TestMakeRequest:
 
         assert result == {"data": "test"}
         expected_url = "https://api.football-data.org/v4/test-endpoint"
-        mock_get.assert_called_once_with(
-            expected_url,
-            headers={"X-Auth-Token": "test_api_key"},
-            timeout=10
-        )
+        mock_get.assert_called_once_with(expected_url, timeout=10)
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_with_leading_slash(self, mock_get, api_service):
         """Test API request with leading slash in endpoint."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         api_service._make_request("/test-endpoint")
 
         expected_url = "https://api.football-data.org/v4/test-endpoint"
-        mock_get.assert_called_once_with(
-            expected_url,
-            headers={"X-Auth-Token": "test_api_key"},
-            timeout=10
-        )
+        mock_get.assert_called_once_with(expected_url, timeout=10)
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_handles_trailing_slash_in_base_url(self, mock_get, mock_config):
         """Test API request handling of trailing slash in base URL."""
         mock_config.base_url = "https://api.football-data.org/v4/"
         service = FootballAPIService(mock_config)
 
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         service._make_request("test-endpoint")
 
         expected_url = "https://api.football-data.org/v4/test-endpoint"
-        mock_get.assert_called_once_with(
-            expected_url,
-            headers={"X-Auth-Token": "test_api_key"},
-            timeout=10
-        )
+        mock_get.assert_called_once_with(expected_url, timeout=10)
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_http_error(self, mock_get, api_service):
         """Test API request with HTTP error."""
         mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
@@ -187,7 +182,7 @@ class TestMakeRequest:
         with pytest.raises(FootballAPIError, match="Failed to fetch data.*after 4 attempts.*404 Not Found"):
             api_service._make_request("test-endpoint")
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_connection_error(self, mock_get, api_service):
         """Test API request with connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -196,7 +191,7 @@ class TestMakeRequest:
         with pytest.raises(FootballAPIError, match="Failed to fetch data.*after 4 attempts.*Connection failed"):
             api_service._make_request("test-endpoint")
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_timeout_error(self, mock_get, api_service):
         """Test API request with timeout error."""
         mock_get.side_effect = requests.exceptions.Timeout("Timeout occurred")
@@ -204,29 +199,98 @@ class TestMakeRequest:
         with pytest.raises(FootballAPIError, match="Failed to fetch data.*after 4 attempts.*Timeout occurred"):
             api_service._make_request("test-endpoint")
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_json_decode_error(self, mock_get, api_service):
         """Test API request with JSON decode error."""
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError(
-            "Invalid JSON", "", 0)
+        mock_response.content = b"not valid json"
         mock_get.return_value = mock_response
 
         with pytest.raises(FootballAPIError, match="Invalid JSON response.*after 4 attempts"):
             api_service._make_request("test-endpoint")
 
 
+class TestConditionalRequests:
+    """Test ETag-based conditional requests."""
+
+    @patch('services.football_api_service.requests.Session.get')
+    def test_etag_sent_on_revalidation(self, mock_get, api_service):
+        """Test that a stored ETag is sent as If-None-Match on the next call."""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.content = b'{"data": "test"}'
+        first_response.raise_for_status.return_value = None
+        first_response.headers = {"ETag": '"abc123"'}
+
+        second_response = Mock()
+        second_response.status_code = 200
+        second_response.content = b'{"data": "changed"}'
+        second_response.raise_for_status.return_value = None
+        second_response.headers = {"ETag": '"def456"'}
+
+        mock_get.side_effect = [first_response, second_response]
+
+        api_service._make_request("test-endpoint")
+        result = api_service._make_request("test-endpoint")
+
+        assert result == {"data": "changed"}
+        expected_url = "https://api.football-data.org/v4/test-endpoint"
+        mock_get.assert_called_with(
+            expected_url,
+            headers={"If-None-Match": '"abc123"'},
+            timeout=10
+        )
+
+    @patch('services.football_api_service.requests.Session.get')
+    def test_not_modified_reuses_parsed_payload(self, mock_get, api_service):
+        """Test that a 304 response returns the previously parsed payload."""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.content = b'{"data": "test"}'
+        first_response.raise_for_status.return_value = None
+        first_response.headers = {"ETag": '"abc123"'}
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+
+        mock_get.side_effect = [first_response, not_modified]
+
+        first_result = api_service._make_request("test-endpoint")
+        second_result = api_service._make_request("test-endpoint")
+
+        # Same parsed object, no re-parse of the body
+        assert second_result is first_result
+        not_modified.raise_for_status.assert_not_called()
+
+    @patch('services.football_api_service.requests.Session.get')
+    def test_no_conditional_header_without_etag(self, mock_get, api_service):
+        """Test that responses without an ETag never trigger revalidation."""
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"data": "test"}'
+        response.raise_for_status.return_value = None
+        response.headers = {}
+
+        mock_get.return_value = response
+
+        api_service._make_request("test-endpoint")
+        api_service._make_request("test-endpoint")
+
+        expected_url = "https://api.football-data.org/v4/test-endpoint"
+        mock_get.assert_called_with(expected_url, timeout=10)
+
+
 class TestRetryMechanism:
     """Test the retry mechanism functionality."""
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_retry_on_connection_error(self, mock_get, mock_sleep, api_service):
         """Test that connection errors trigger retries."""
         # First three calls fail, fourth succeeds
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = b'{"data": "success"}'
         mock_response.raise_for_status.return_value = None
 
         mock_get.side_effect = [
@@ -246,14 +310,14 @@ class TestRetryMechanism:
         mock_sleep.assert_any_call(4)  # Third retry: 2^2 = 4s
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_retry_on_server_error(self, mock_get, mock_sleep, api_service):
         """Test that server errors (5xx) trigger retries."""
         mock_response_error = Mock()
         mock_response_error.status_code = 500
 
         mock_response_success = Mock()
-        mock_response_success.json.return_value = {"data": "success"}
+        mock_response_success.content = b'{"data": "success"}'
         mock_response_success.raise_for_status.return_value = None
 
         server_error = requests.exceptions.HTTPError("500 Server Error")
@@ -272,7 +336,7 @@ class TestRetryMechanism:
         assert mock_sleep.call_count == 2
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_no_retry_on_client_error(self, mock_get, mock_sleep, api_service):
         """Test that client errors (4xx) do not trigger retries."""
         mock_response = Mock()
@@ -290,7 +354,7 @@ class TestRetryMechanism:
         assert mock_sleep.call_count == 0  # No retries, so no sleep
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_retry_exhausted(self, mock_get, mock_sleep, api_service):
         """Test behavior when all retries are exhausted."""
         mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -303,17 +367,16 @@ class TestRetryMechanism:
         assert mock_sleep.call_count == 3
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_retry_json_decode_error(self, mock_get, mock_sleep, api_service):
         """Test that JSON decode errors trigger retries."""
         mock_response_error = Mock()
         mock_response_error.raise_for_status.return_value = None
-        mock_response_error.json.side_effect = json.JSONDecodeError(
-            "Invalid JSON", "", 0)
+        mock_response_error.content = b"not valid json"
 
         mock_response_success = Mock()
         mock_response_success.raise_for_status.return_value = None
-        mock_response_success.json.return_value = {"data": "success"}
+        mock_response_success.content = b'{"data": "success"}'
 
         mock_get.side_effect = [
             mock_response_error,
@@ -328,7 +391,7 @@ class TestRetryMechanism:
         assert mock_sleep.call_count == 2
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_custom_max_retries(self, mock_get, mock_sleep, api_service):
         """Test custom max_retries parameter."""
         mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -341,7 +404,7 @@ class TestRetryMechanism:
         assert mock_sleep.call_count == 1
 
     @patch('services.football_api_service.time.sleep')
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_no_retries(self, mock_get, mock_sleep, api_service):
         """Test behavior with max_retries=0."""
         mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -353,11 +416,11 @@ class TestRetryMechanism:
         assert mock_get.call_count == 1
         assert mock_sleep.call_count == 0
 
-    @patch('services.football_api_service.requests.get')
+    @patch('services.football_api_service.requests.Session.get')
     def test_make_request_first_attempt_success(self, mock_get, api_service):
         """Test that successful first attempt doesn't trigger retries."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = b'{"data": "success"}'
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -470,6 +533,81 @@ class TestGetTeams:
         mock_team_from_api.assert_not_called()
 
 
+class TestDiskCache:
+    """Test persistence of the teams cache to disk."""
+
+    def test_disk_cache_disabled_without_cache_dir(self, api_service):
+        """Test that no disk cache is used when cache_dir is not set."""
+        assert api_service.cache_dir is None
+        assert not api_service._load_cache_from_disk()
+
+    def test_disk_cache_survives_restart(self, mock_config, sample_teams_api_response, tmp_path):
+        """Test that a second service instance reuses the persisted cache."""
+        cache_dir = str(tmp_path / "premier-nlp")
+
+        service1 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        with patch.object(service1, '_make_request') as mock_request:
+            mock_request.return_value = sample_teams_api_response
+            teams1 = service1.get_teams()
+            assert len(teams1) == 2
+
+        # Simulate a process restart with a fresh instance
+        service2 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        with patch.object(service2, '_make_request') as mock_request:
+            teams2 = service2.get_teams()
+            mock_request.assert_not_called()
+
+        assert [team.name for team in teams2] == [
+            team.name for team in teams1]
+
+    def test_disk_cache_expired_triggers_fetch(self, mock_config, sample_teams_api_response, tmp_path):
+        """Test that an expired disk cache still triggers an API call."""
+        cache_dir = str(tmp_path / "premier-nlp")
+
+        service1 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        stale_timestamp = datetime.now() - timedelta(hours=25)
+        service1._save_cache_to_disk(
+            sample_teams_api_response["teams"], stale_timestamp)
+
+        service2 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        with patch.object(service2, '_make_request') as mock_request:
+            mock_request.return_value = sample_teams_api_response
+            service2.get_teams(cache_ttl_hours=24)
+            mock_request.assert_called_once()
+
+    def test_disk_cache_stale_fallback_on_api_error(self, mock_config, sample_teams_api_response, tmp_path):
+        """Test that a stale disk cache is used when the API fails."""
+        cache_dir = str(tmp_path / "premier-nlp")
+
+        service1 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        stale_timestamp = datetime.now() - timedelta(hours=25)
+        service1._save_cache_to_disk(
+            sample_teams_api_response["teams"], stale_timestamp)
+
+        service2 = FootballAPIService(mock_config, cache_dir=cache_dir)
+        with patch.object(service2, '_make_request') as mock_request:
+            mock_request.side_effect = FootballAPIError("API failed")
+            teams = service2.get_teams()
+
+        assert len(teams) == 2
+
+    def test_disk_cache_corrupt_file_ignored(self, mock_config, sample_teams_api_response, tmp_path):
+        """Test that a corrupt cache file falls back to the API."""
+        cache_dir = str(tmp_path / "premier-nlp")
+        service = FootballAPIService(mock_config, cache_dir=cache_dir)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(service._disk_cache_path(), "w", encoding="utf-8") as f:
+            f.write("not json")
+
+        with patch.object(service, '_make_request') as mock_request:
+            mock_request.return_value = sample_teams_api_response
+            teams = service.get_teams()
+            mock_request.assert_called_once()
+
+        assert len(teams) == 2
+
+
 class TestIntegrationScenarios:
     """Test integration scenarios and edge cases."""
 
@@ -5,6 +5,7 @@ Tests cover all tool methods and LangChain tool integration functionality.
 
 import pytest
 import json
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import langchain
@@ -14,6 +15,24 @@ from data_classes.team import Team
 from data_classes.player import Player
 
 
+def make_fake_players(n):
+    """Build n lightweight player stand-ins.
+
+    SimpleNamespace skips unittest.mock's per-attribute spec introspection,
+    which matters for the bulk-dataset tests that need 100 players.
+    """
+    return [
+        SimpleNamespace(
+            name=f"Player {i}",
+            position=f"Position {i % 10}",
+            nationality=f"Country {i % 10}",
+            date_of_birth="1990-01-01",
+            age=33,
+        )
+        for i in range(n)
+    ]
+
+
 @pytest.fixture
 def mock_search_service():
     """Create a mock SearchService."""
@@ -21,29 +40,36 @@ def mock_search_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_player():
-    """Create a mock Player."""
-    player = Mock(spec=Player)
-    player.name = "Mohamed Salah"
-    player.position = "Right Winger"
-    player.nationality = "Egypt"
-    player.date_of_birth = "1992-06-15"
-    player.age = 31
-    return player
+    """Create a lightweight player stand-in.
+
+    No test mutates it, so one instance is shared across the module.
+    """
+    return SimpleNamespace(
+        name="Mohamed Salah",
+        position="Right Winger",
+        nationality="Egypt",
+        date_of_birth="1992-06-15",
+        age=31,
+    )
 
 
 @pytest.fixture
 def mock_team():
-    """Create a mock Team."""
-    team = Mock(spec=Team)
-    team.name = "Liverpool FC"
-    team.short_name = "Liverpool"
-    team.tla = "LIV"
-    team.founded = 1892
-    team.club_colors = "Red / White"
-    team.venue = "Anfield"
-    return team
+    """Create a lightweight team stand-in.
+
+    Function-scoped because several tests assign their own squad.
+    """
+    return SimpleNamespace(
+        name="Liverpool FC",
+        short_name="Liverpool",
+        tla="LIV",
+        founded=1892,
+        club_colors="Red / White",
+        venue="Anfield",
+        squad=[],
+    )
 
 
 @pytest.fixture
@@ -131,6 +157,27 @@ class TestGetPlayerInfo:
         assert result_data["Date of Birth"] is None
         assert result_data["Age"] is None
 
+    def test_get_player_info_repeated_query_uses_cache(self, football_tools, mock_player, mock_team):
+        """Test that a repeated player query skips the search service."""
+        football_tools.search_service.find_player.return_value = (
+            mock_player, mock_team)
+
+        first = football_tools.get_player_info("Mohamed Salah")
+        second = football_tools.get_player_info("  mohamed salah  ")
+
+        assert first == second
+        football_tools.search_service.find_player.assert_called_once_with(
+            "Mohamed Salah")
+
+    def test_get_player_info_not_found_not_cached(self, football_tools):
+        """Test that miss responses are not memoized."""
+        football_tools.search_service.find_player.return_value = None
+
+        football_tools.get_player_info("Unknown Player")
+        football_tools.get_player_info("Unknown Player")
+
+        assert football_tools.search_service.find_player.call_count == 2
+
 
 class TestGetTeamInfo:
     """Test the get_team_info method."""
@@ -189,6 +236,31 @@ class TestGetTeamInfo:
         result_data = json.loads(result)
         assert result_data["Squad"] == []
 
+    def test_get_team_info_repeated_query_uses_cache(self, football_tools, mock_team, mock_player):
+        """Test that a repeated team query skips the search service."""
+        mock_team.squad = [mock_player]
+        football_tools.search_service.find_team.return_value = mock_team
+
+        first = football_tools.get_team_info("Liverpool FC")
+        second = football_tools.get_team_info("liverpool fc")
+
+        assert first == second
+        football_tools.search_service.find_team.assert_called_once_with(
+            "Liverpool FC")
+
+    def test_get_team_info_cache_cleared_on_teams_refresh(self, football_tools, mock_team, mock_player):
+        """Test that a teams refresh drops the memoized responses."""
+        mock_team.squad = [mock_player]
+        football_tools.search_service.find_team.return_value = mock_team
+        # Each call hands out a different teams list, as after a refresh
+        football_tools.search_service.current_teams.side_effect = [
+            ["generation-1"], ["generation-2"]]
+
+        football_tools.get_team_info("Liverpool FC")
+        football_tools.get_team_info("Liverpool FC")
+
+        assert football_tools.search_service.find_team.call_count == 2
+
     def test_get_team_info_with_none_values(self, football_tools):
         """Test team info with None values in team data."""
         team_with_nones = Mock(spec=Team)
@@ -237,6 +309,20 @@ class TestFindPlayersByTeamAndPosition:
         football_tools.search_service.find_players_by_team_and_position.assert_called_once_with(
             "Liverpool", "Winger")
 
+    def test_find_players_by_team_and_position_repeated_query_uses_cache(self, football_tools, mock_player):
+        """Test that a repeated position query skips the search service."""
+        football_tools.search_service.find_players_by_team_and_position.return_value = [
+            mock_player]
+
+        first = football_tools.find_players_by_team_and_position(
+            "Liverpool, Winger")
+        second = football_tools.find_players_by_team_and_position(
+            "Liverpool ,  Winger")
+
+        assert first == second
+        football_tools.search_service.find_players_by_team_and_position.assert_called_once_with(
+            "Liverpool", "Winger")
+
     def test_find_players_by_team_and_position_dash_separator(self, football_tools, mock_player):
         """Test finding players with dash separator."""
         football_tools.search_service.find_players_by_team_and_position.return_value = [
@@ -399,6 +485,10 @@ class TestGetTools:
         assert tool_dict["Team_Info"] == football_tools_extended.get_team_info
         assert tool_dict["Players_By_Team_And_Position"] == football_tools_extended.find_players_by_team_and_position
 
+    def test_get_tools_reuses_built_list(self, football_tools):
+        """Test that repeated calls return the same cached tool list."""
+        assert football_tools.get_tools() is football_tools.get_tools()
+
 
 class TestIntegrationScenarios:
     """Test integration scenarios and complex use cases."""
@@ -446,15 +536,7 @@ class TestIntegrationScenarios:
     def test_json_serialization_with_complex_data(self, football_tools):
         """Test JSON serialization with complex nested data structures."""
         # Create complex mock data
-        mock_players = []
-        for i in range(3):
-            player = Mock(spec=Player)
-            player.name = f"Player {i}"
-            player.position = f"Position {i}"
-            player.nationality = f"Country {i}"
-            player.date_of_birth = f"199{i}-01-01"
-            player.age = 30 + i
-            mock_players.append(player)
+        mock_players = make_fake_players(3)
 
         mock_team = Mock(spec=Team)
         mock_team.name = "Complex Team"
@@ -477,16 +559,8 @@ class TestIntegrationScenarios:
 
     def test_memory_efficiency_with_large_datasets(self, football_tools):
         """Test memory efficiency with large numbers of players/teams."""
-        # Create a large number of mock players
-        large_player_list = []
-        for i in range(100):
-            player = Mock(spec=Player)
-            player.name = f"Player {i}"
-            # Rotate through 10 countries
-            player.nationality = f"Country {i % 10}"
-            player.date_of_birth = "1990-01-01"
-            player.age = 33
-            large_player_list.append(player)
+        # Create a large number of lightweight players
+        large_player_list = make_fake_players(100)
 
         football_tools.search_service.find_players_by_team_and_position.return_value = large_player_list
 
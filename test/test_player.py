@@ -3,6 +3,10 @@ Unit tests for the Player dataclass.
 Tests cover initialization, API data conversion, and age calculation functionality.
 """
 
+import dataclasses
+
+import pytest
+
 from datetime import date
 from unittest.mock import patch
 from data_classes.player import Player
@@ -118,6 +122,69 @@ class TestPlayerFromApiData:
             mock_age.assert_called_once_with('1990-12-25')
 
 
+class TestPlayerFromApiList:
+    """Test Player.from_api_list class method."""
+
+    def test_from_api_list_bulk_creation(self):
+        """Test creating multiple players from a list of API records."""
+        api_data_list = [
+            {
+                'id': 123,
+                'name': 'Mohamed Salah',
+                'position': 'Right Winger',
+                'nationality': 'Egypt',
+                'dateOfBirth': '1992-06-15'
+            },
+            {
+                'id': 456,
+                'name': 'Unknown Player'
+            }
+        ]
+
+        players = Player.from_api_list(api_data_list)
+
+        assert len(players) == 2
+        assert players[0].id == 123
+        assert players[0].name == 'Mohamed Salah'
+        assert players[0].position == 'Right Winger'
+        assert players[0].date_of_birth == '1992-06-15'
+        assert players[1].id == 456
+        assert players[1].age is None
+
+    def test_from_api_list_matches_from_api_data(self):
+        """Test that bulk creation produces the same players as single creation."""
+        api_data = {
+            'id': 123,
+            'name': 'Mohamed Salah',
+            'position': 'Right Winger',
+            'nationality': 'Egypt',
+            'dateOfBirth': '1992-06-15'
+        }
+
+        assert Player.from_api_list([api_data]) == [
+            Player.from_api_data(api_data)]
+
+    def test_from_api_list_empty(self):
+        """Test bulk creation with an empty list."""
+        assert Player.from_api_list([]) == []
+
+    def test_from_api_list_resolves_today_once(self):
+        """Test that today's date is looked up once for the whole batch."""
+        api_data_list = [
+            {'id': i, 'name': f'Player {i}', 'dateOfBirth': '1990-01-01'}
+            for i in range(3)
+        ]
+
+        with patch('data_classes.player.date') as mock_date:
+            mock_date.today.return_value = date(2025, 9, 19)
+            mock_date.fromisoformat.return_value = date(1990, 1, 1)
+
+            players = Player.from_api_list(api_data_list)
+
+            assert [p.age for p in players] == [35, 35, 35]
+            mock_date.today.assert_called_once()
+
+
 class TestCalculateAge:
     """Test Player.calculate_age static method."""
 
@@ -183,6 +250,14 @@ class TestCalculateAge:
             age = Player.calculate_age(invalid_date)
             assert age is None, f"Expected None for invalid date: {invalid_date}"
 
+    def test_calculate_age_malformed_date_skips_parsing(self):
+        """Test that obviously malformed dates never reach fromisoformat."""
+        with patch('data_classes.player.date') as mock_date:
+            age = Player.calculate_age('not-a-date')
+
+            assert age is None
+            mock_date.fromisoformat.assert_not_called()
+
     def test_calculate_age_future_date(self):
         """Test age calculation with a future birth date."""
         with patch('data_classes.player.date') as mock_date:
@@ -241,3 +316,10 @@ class TestPlayerDataclassFeatures:
         assert "Test Player" in repr_str
         assert "Forward" in repr_str
         assert "England" in repr_str
+
+    def test_player_is_immutable(self):
+        """Test that player fields cannot be reassigned."""
+        player = Player(id=1, name="Test Player")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            player.name = "Renamed"
@@ -4,7 +4,7 @@ Tests cover team and player search functionality with fuzzy matching.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from services.search_service import SearchService
 from data_classes.team import Team
@@ -13,73 +13,38 @@ from data_classes.player import Player
 
 @pytest.fixture
 def mock_players():
-    """Create mock players for testing."""
-    player1 = Mock(spec=Player)
-    player1.name = "Mohamed Salah"
-    player1.position = "Right Winger"
-    player1.nationality = "Egypt"
-    player1.date_of_birth = "1992-06-15"
-    player1.age = 31
-
-    player2 = Mock(spec=Player)
-    player2.name = "Sadio Mané"
-    player2.position = "Left Winger"
-    player2.nationality = "Senegal"
-    player2.date_of_birth = "1992-04-10"
-    player2.age = 31
-
-    player3 = Mock(spec=Player)
-    player3.name = "Virgil van Dijk"
-    player3.position = "Centre-Back"
-    player3.nationality = "Netherlands"
-    player3.date_of_birth = "1991-07-08"
-    player3.age = 32
-
-    player4 = Mock(spec=Player)
-    player4.name = "Alisson Becker"
-    player4.position = "Goalkeeper"
-    player4.nationality = "Brazil"
-    player4.date_of_birth = "1993-10-02"
-    player4.age = 30
-
-    player5 = Mock(spec=Player)
-    player5.name = "Bruno Fernandes"
-    player5.position = "Attacking Midfielder"
-    player5.nationality = "Portugal"
-    player5.date_of_birth = "1994-09-08"
-    player5.age = 29
-
-    return [player1, player2, player3, player4, player5]
+    """Create players for testing.
+
+    Real Player instances are slotted dataclasses, so constructing
+    them directly is cheaper than Mock(spec=Player) and gives the same
+    attribute surface.
+    """
+    return [
+        Player(id=1, name="Mohamed Salah", position="Right Winger",
+               nationality="Egypt", date_of_birth="1992-06-15", age=31),
+        Player(id=2, name="Sadio Mané", position="Left Winger",
+               nationality="Senegal", date_of_birth="1992-04-10", age=31),
+        Player(id=3, name="Virgil van Dijk", position="Centre-Back",
+               nationality="Netherlands", date_of_birth="1991-07-08", age=32),
+        Player(id=4, name="Alisson Becker", position="Goalkeeper",
+               nationality="Brazil", date_of_birth="1993-10-02", age=30),
+        Player(id=5, name="Bruno Fernandes", position="Attacking Midfielder",
+               nationality="Portugal", date_of_birth="1994-09-08", age=29),
+    ]
 
 
 @pytest.fixture
 def mock_teams(mock_players):
-    """Create mock teams with players for testing."""
-    # Liverpool team
-    liverpool = Mock(spec=Team)
-    liverpool.id = 1
-    liverpool.name = "Liverpool FC"
-    liverpool.short_name = "Liverpool"
-    liverpool.tla = "LIV"
-    liverpool.squad = mock_players[:4]  # First 4 players
-
-    # Manchester United team
-    man_united = Mock(spec=Team)
-    man_united.id = 2
-    man_united.name = "Manchester United FC"
-    man_united.short_name = "Man United"
-    man_united.tla = "MUN"
-    man_united.squad = [mock_players[4]]  # Last player
-
-    # Arsenal team (no players for testing edge cases)
-    arsenal = Mock(spec=Team)
-    arsenal.id = 3
-    arsenal.name = "Arsenal FC"
-    arsenal.short_name = "Arsenal"
-    arsenal.tla = "ARS"
-    arsenal.squad = []
-
-    return [liverpool, man_united, arsenal]
+    """Create teams with players for testing."""
+    return [
+        Team(id=1, name="Liverpool FC", short_name="Liverpool", tla="LIV",
+             squad=mock_players[:4]),  # First 4 players
+        Team(id=2, name="Manchester United FC", short_name="Man United",
+             tla="MUN", squad=[mock_players[4]]),  # Last player
+        # Arsenal has no players for testing edge cases
+        Team(id=3, name="Arsenal FC", short_name="Arsenal", tla="ARS",
+             squad=[]),
+    ]
 
 
 @pytest.fixture
@@ -411,6 +376,185 @@ class TestFindPlayersByTeamAndPosition:
         assert "Midfielder" in players[0].position
 
 
+class TestTeamCandidateIndex:
+    """Test the cached flattened team candidate arrays."""
+
+    def test_team_index_reused_for_same_teams_list(self, search_service):
+        """Test that repeated lookups reuse the candidate arrays."""
+        search_service.find_team("Liverpool FC")
+        candidates1 = search_service._team_candidates
+
+        search_service.find_team("Arsenal FC")
+        candidates2 = search_service._team_candidates
+
+        assert candidates1 is candidates2
+
+    def test_team_index_rebuilt_for_new_teams_list(self, search_service, mock_teams):
+        """Test that a refreshed teams list triggers an index rebuild."""
+        search_service.find_team("Liverpool FC")
+        candidates1 = search_service._team_candidates
+
+        search_service.teams_data_store.get_teams.return_value = list(
+            mock_teams)
+        search_service.find_team("Liverpool FC")
+        candidates2 = search_service._team_candidates
+
+        assert candidates1 is not candidates2
+
+    def test_team_index_skips_missing_fields(self):
+        """Test that None short_name/tla fields produce no candidates."""
+        team = Mock(spec=Team)
+        team.name = "Test Team"
+        team.short_name = None
+        team.tla = None
+
+        mock_data_store = Mock()
+        mock_data_store.get_teams.return_value = [team]
+        service = SearchService(mock_data_store)
+
+        candidates, owners = service._get_team_index([team])
+        assert candidates == ["test team"]
+        assert owners == [team]
+
+    def test_exact_team_name_skips_fuzzy_scan(self, search_service):
+        """Test that an exact (case-insensitive) name resolves without scoring."""
+        with patch('services.search_service.process.extractOne') as mock_extract:
+            result = search_service.find_team("liverpool fc")
+
+        assert result.name == "Liverpool FC"
+        mock_extract.assert_not_called()
+
+
+class TestPlayerCandidateIndex:
+    """Test the cached flattened player candidate arrays."""
+
+    def test_player_index_reused_for_same_teams_list(self, search_service):
+        """Test that repeated lookups reuse the candidate arrays."""
+        search_service.find_player("Mohamed Salah")
+        candidates1 = search_service._player_candidates
+
+        search_service.find_player("Bruno Fernandes")
+        candidates2 = search_service._player_candidates
+
+        assert candidates1 is candidates2
+
+    def test_player_index_rebuilt_for_new_teams_list(self, search_service, mock_teams):
+        """Test that a refreshed teams list triggers an index rebuild."""
+        search_service.find_player("Mohamed Salah")
+        candidates1 = search_service._player_candidates
+
+        search_service.teams_data_store.get_teams.return_value = list(
+            mock_teams)
+        search_service.find_player("Mohamed Salah")
+        candidates2 = search_service._player_candidates
+
+        assert candidates1 is not candidates2
+
+    def test_player_index_maps_players_to_teams(self, search_service, mock_teams):
+        """Test that candidates stay aligned with their (player, team) owners."""
+        teams = search_service.teams_data_store.get_teams()
+        candidates, owners = search_service._get_player_index(teams)
+
+        assert len(candidates) == len(owners)
+        index = candidates.index("bruno fernandes")
+        player, team = owners[index]
+        assert player.name == "Bruno Fernandes"
+        assert team.name == "Manchester United FC"
+
+
+    def test_exact_player_name_skips_fuzzy_scan(self, search_service):
+        """Test that an exact (case-insensitive) name resolves without scoring."""
+        with patch('services.search_service.process.extractOne') as mock_extract:
+            result = search_service.find_player("mohamed salah")
+
+        player, team = result
+        assert player.name == "Mohamed Salah"
+        mock_extract.assert_not_called()
+
+
+class TestResultMemoization:
+    """Test the per-index memoization of fuzzy lookup results."""
+
+    def test_repeated_fuzzy_team_query_uses_memo(self, search_service):
+        """Test that a repeated misspelled query skips the scorer."""
+        first = search_service.find_team("Liverpol")
+
+        with patch('services.search_service.process.extractOne') as mock_extract:
+            second = search_service.find_team("Liverpol")
+
+        assert first is second
+        mock_extract.assert_not_called()
+
+    def test_repeated_fuzzy_player_query_uses_memo(self, search_service):
+        """Test that a repeated misspelled player query skips the scorer."""
+        first = search_service.find_player("Mohammed Salah")
+
+        with patch('services.search_service.process.extractOne') as mock_extract:
+            second = search_service.find_player("Mohammed Salah")
+
+        assert first == second
+        mock_extract.assert_not_called()
+
+    def test_memo_cleared_when_index_rebuilt(self, search_service, mock_teams):
+        """Test that a refreshed teams list drops memoized results."""
+        search_service.find_team("Liverpol")
+        assert len(search_service._team_result_cache) == 1
+
+        search_service.teams_data_store.get_teams.return_value = list(
+            mock_teams)
+        search_service.find_team("Arsenal FC")
+
+        assert ("liverpol", 0.6) not in search_service._team_result_cache
+
+    def test_memo_keyed_by_threshold(self, search_service):
+        """Test that different thresholds are cached independently."""
+        search_service.find_team("Liverpol", threshold=0.6)
+        search_service.find_team("Liverpol", threshold=0.9)
+
+        assert len(search_service._team_result_cache) == 2
+
+
+class TestPositionIndex:
+    """Test the cached per-team position index."""
+
+    def test_position_index_reused_for_same_teams_list(self, search_service, mock_teams):
+        """Test that repeated lookups reuse the index for the same teams list."""
+        search_service.find_players_by_team_and_position(
+            "Liverpool FC", "Goalkeeper")
+        index1 = search_service._position_index
+
+        search_service.find_players_by_team_and_position(
+            "Liverpool FC", "Winger")
+        index2 = search_service._position_index
+
+        assert index1 is index2
+
+    def test_position_index_rebuilt_for_new_teams_list(self, search_service, mock_teams):
+        """Test that a refreshed teams list triggers an index rebuild."""
+        search_service.find_players_by_team_and_position(
+            "Liverpool FC", "Goalkeeper")
+        index1 = search_service._position_index
+
+        # Simulate a cache refresh handing out a new list object
+        search_service.teams_data_store.get_teams.return_value = list(
+            mock_teams)
+        search_service.find_players_by_team_and_position(
+            "Liverpool FC", "Goalkeeper")
+        index2 = search_service._position_index
+
+        assert index1 is not index2
+
+    def test_position_index_groups_players_by_position(self, search_service, mock_teams):
+        """Test that the index groups squad members under lowercased positions."""
+        teams = search_service.teams_data_store.get_teams()
+        index = search_service._get_position_index(teams)
+
+        liverpool_index = index[id(mock_teams[0])]
+        assert "goalkeeper" in liverpool_index
+        assert [p.name for p in liverpool_index["goalkeeper"]] == [
+            "Alisson Becker"]
+
+
 class TestEdgeCasesAndErrorHandling:
     """Test edge cases and error handling."""
 
@@ -6,7 +6,6 @@ Tests cover initialization, API data conversion, and squad management functional
 from unittest.mock import Mock, patch
 import pytest
 from data_classes.team import Team
-from data_classes.player import Player
 
 
 class TestTeamInitialization:
@@ -25,9 +24,9 @@ class TestTeamInitialization:
         assert team.venue is None
         assert team.squad == []  # Should be initialized as empty list
 
-    def test_team_with_all_fields(self):
+    def test_team_with_all_fields(self, make_player_mock):
         """Test creating a team with all fields."""
-        mock_player = Mock(spec=Player)
+        mock_player = make_player_mock()
         squad = [mock_player]
 
         team = Team(
@@ -55,24 +54,36 @@ class TestTeamInitialization:
         team = Team(id=1, name="Test Team", squad=None)
         assert team.squad == []
 
-    def test_team_post_init_with_existing_squad(self):
+    def test_team_post_init_with_existing_squad(self, make_player_mock):
         """Test that __post_init__ preserves existing squad."""
-        mock_player = Mock(spec=Player)
+        mock_player = make_player_mock()
         squad = [mock_player]
         team = Team(id=1, name="Test Team", squad=squad)
         assert team.squad == squad
 
 
+@pytest.fixture(scope="class")
+def _patched_player_class():
+    """Patch data_classes.team.Player once per test class."""
+    with patch('data_classes.team.Player') as mock_player_class:
+        yield mock_player_class
+
+
 class TestTeamFromApiData:
     """Test Team.from_api_data class method."""
 
-    @patch('data_classes.team.Player')
-    def test_from_api_data_complete(self, mock_player_class):
+    @pytest.fixture
+    def mock_player_class(self, _patched_player_class):
+        """Hand out the class-wide patch mock, reset for this test."""
+        _patched_player_class.reset_mock(return_value=True, side_effect=True)
+        return _patched_player_class
+
+    def test_from_api_data_complete(self, mock_player_class, make_player_mock):
         """Test creating team from complete API data."""
-        # Mock Player.from_api_data to return mock player instances
-        mock_player1 = Mock(spec=Player)
-        mock_player2 = Mock(spec=Player)
-        mock_player_class.from_api_data.side_effect = [
+        # Mock Player.from_api_list to return mock player instances
+        mock_player1 = make_player_mock()
+        mock_player2 = make_player_mock()
+        mock_player_class.from_api_list.return_value = [
             mock_player1, mock_player2]
 
         api_data = {
@@ -101,14 +112,12 @@ class TestTeamFromApiData:
         assert len(team.squad) == 2
         assert team.squad == [mock_player1, mock_player2]
 
-        # Verify Player.from_api_data was called with correct data
-        assert mock_player_class.from_api_data.call_count == 2
-        mock_player_class.from_api_data.assert_any_call(
-            {'id': 1, 'name': 'Player 1'})
-        mock_player_class.from_api_data.assert_any_call(
-            {'id': 2, 'name': 'Player 2'})
+        # Verify Player.from_api_list was called once with the full squad
+        mock_player_class.from_api_list.assert_called_once_with([
+            {'id': 1, 'name': 'Player 1'},
+            {'id': 2, 'name': 'Player 2'}
+        ])
 
-    @patch('data_classes.team.Player')
     def test_from_api_data_minimal(self, mock_player_class):
         """Test creating team from minimal API data."""
         api_data = {
@@ -127,10 +136,9 @@ class TestTeamFromApiData:
         assert team.venue is None
         assert team.squad == []
 
-        # Verify Player.from_api_data was not called since no squad data
-        mock_player_class.from_api_data.assert_not_called()
+        # Verify Player.from_api_list was not called since no squad data
+        mock_player_class.from_api_list.assert_not_called()
 
-    @patch('data_classes.team.Player')
     def test_from_api_data_missing_id(self, mock_player_class):
         """Test creating team when ID is missing."""
         api_data = {
@@ -144,7 +152,6 @@ class TestTeamFromApiData:
         assert team.name == 'Team Without ID'
         assert team.founded == 2000
 
-    @patch('data_classes.team.Player')
     def test_from_api_data_missing_name(self, mock_player_class):
         """Test creating team when name is missing."""
         api_data = {
@@ -158,7 +165,6 @@ class TestTeamFromApiData:
         assert team.name == ''  # Default value
         assert team.venue == 'Some Stadium'
 
-    @patch('data_classes.team.Player')
     def test_from_api_data_empty_squad(self, mock_player_class):
         """Test creating team with empty squad array."""
         api_data = {
@@ -172,13 +178,12 @@ class TestTeamFromApiData:
         assert team.id == 100
         assert team.name == 'Empty Squad Team'
         assert team.squad == []
-        mock_player_class.from_api_data.assert_not_called()
+        mock_player_class.from_api_list.assert_not_called()
 
-    @patch('data_classes.team.Player')
     def test_from_api_data_player_creation_error(self, mock_player_class):
         """Test handling of player creation errors during team creation."""
-        # Mock Player.from_api_data to raise an exception
-        mock_player_class.from_api_data.side_effect = ValueError(
+        # Mock Player.from_api_list to raise an exception
+        mock_player_class.from_api_list.side_effect = ValueError(
             "Invalid player data")
 
         api_data = {
@@ -191,11 +196,11 @@ class TestTeamFromApiData:
         with pytest.raises(ValueError, match="Invalid player data"):
             Team.from_api_data(api_data)
 
-    @patch('data_classes.team.Player')
-    def test_from_api_data_with_none_squad_data(self, mock_player_class):
+    def test_from_api_data_with_none_squad_data(self, mock_player_class,
+                                                make_player_mock):
         """Test creating team when squad data contains None values."""
-        mock_player = Mock(spec=Player)
-        mock_player_class.from_api_data.return_value = mock_player
+        mock_player = make_player_mock()
+        mock_player_class.from_api_list.return_value = [mock_player]
 
         api_data = {
             'id': 300,
@@ -208,7 +213,7 @@ class TestTeamFromApiData:
         assert team.id == 300
         assert team.name == 'None Squad Team'
         assert team.squad == []  # Should default to empty list
-        mock_player_class.from_api_data.assert_not_called()
+        mock_player_class.from_api_list.assert_not_called()
 
 
 class TestTeamDataclassFeatures:
@@ -228,19 +233,19 @@ class TestTeamDataclassFeatures:
 
         assert team1 != team2
 
-    def test_team_inequality_different_squad(self):
+    def test_team_inequality_different_squad(self, make_player_mock):
         """Test that teams with different squads are not equal."""
-        mock_player1 = Mock(spec=Player)
-        mock_player2 = Mock(spec=Player)
+        mock_player1 = make_player_mock()
+        mock_player2 = make_player_mock()
 
         team1 = Team(id=1, name="Team", squad=[mock_player1])
         team2 = Team(id=1, name="Team", squad=[mock_player2])
 
         assert team1 != team2
 
-    def test_team_string_representation(self):
+    def test_team_string_representation(self, make_player_mock):
         """Test the string representation of a team."""
-        mock_player = Mock(spec=Player)
+        mock_player = make_player_mock()
         team = Team(
             id=123,
             name="Test Team",
@@ -262,9 +267,9 @@ class TestTeamDataclassFeatures:
         assert "Blue / White" in repr_str
         assert "Test Stadium" in repr_str
 
-    def test_team_with_large_squad(self):
+    def test_team_with_large_squad(self, make_player_mock):
         """Test team with a large squad."""
-        mock_players = [Mock(spec=Player) for _ in range(25)]
+        mock_players = [make_player_mock() for _ in range(25)]
         team = Team(id=1, name="Large Squad Team", squad=mock_players)
 
         assert len(team.squad) == 25
@@ -274,36 +279,28 @@ class TestTeamDataclassFeatures:
 class TestTeamEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_team_with_zero_id(self):
-        """Test team with zero ID."""
-        team = Team(id=0, name="Zero ID Team")
-        assert team.id == 0
-
-    def test_team_with_negative_id(self):
-        """Test team with negative ID."""
-        team = Team(id=-1, name="Negative ID Team")
-        assert team.id == -1
-
-    def test_team_with_empty_name(self):
-        """Test team with empty name."""
-        team = Team(id=1, name="")
-        assert team.name == ""
+    @pytest.mark.parametrize("team_id, name", [
+        (0, "Zero ID Team"),
+        (-1, "Negative ID Team"),
+        (1, ""),
+    ], ids=["zero_id", "negative_id", "empty_name"])
+    def test_team_identity_edge_cases(self, team_id, name):
+        """Test teams with unusual id and name values."""
+        team = Team(id=team_id, name=name)
+        assert team.id == team_id
+        assert team.name == name
 
     def test_team_with_special_characters_in_name(self):
         """Test team with special characters in name."""
         team = Team(id=1, name="Team with Special Chars áéíóú & Co.")
         assert team.name == "Team with Special Chars áéíóú & Co."
 
-    def test_team_founded_edge_cases(self):
+    @pytest.mark.parametrize("team_id, name, founded", [
+        (1, "Old Team", 1800),
+        (2, "Future Team", 3000),
+        (3, "Zero Team", 0),
+    ], ids=["very_old", "future", "zero"])
+    def test_team_founded_edge_cases(self, team_id, name, founded):
         """Test team with various founded year values."""
-        # Very old team
-        old_team = Team(id=1, name="Old Team", founded=1800)
-        assert old_team.founded == 1800
-
-        # Future founded date
-        future_team = Team(id=2, name="Future Team", founded=3000)
-        assert future_team.founded == 3000
-
-        # Zero founded date
-        zero_team = Team(id=3, name="Zero Team", founded=0)
-        assert zero_team.founded == 0
+        team = Team(id=team_id, name=name, founded=founded)
+        assert team.founded == founded
@@ -1,10 +1,15 @@
-from langchain.agents import Tool
-from typing import List
+import re
+from collections import OrderedDict
+from operator import attrgetter
+from typing import List, Optional, TYPE_CHECKING
 from services.football_api_service import FootballAPIService
 from services.search_service import SearchService
-import json
+import orjson
 import logging
 
+if TYPE_CHECKING:
+    from langchain.agents import Tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,14 +19,78 @@ available_positions = ['Attacking Midfield', 'Central Midfield', 'Centre-Back',
                        'Midfield', 'Offence', 'Right Midfield', 'Right Winger',
                        'Right-Back']
 
+# Fixed projections of Player attributes into response keys; attrgetter
+# fetches all fields in one C call instead of per-field attribute lookups.
+_SQUAD_KEYS = ("Name", "Position", "Date of Birth", "Age", "Nationality")
+_squad_fields = attrgetter("name", "position", "date_of_birth", "age",
+                           "nationality")
+_ROSTER_KEYS = ("Name", "Nationality", "Date of Birth", "Age")
+_roster_fields = attrgetter("name", "nationality", "date_of_birth", "age")
+
+# Splits 'team, position' / 'team - position' queries and trims the
+# surrounding whitespace in one compiled regex pass.
+_QUERY_SPLIT = re.compile(r"\s*(?:,|\s-\s)\s*")
+
+# Fixed tool responses, allocated once instead of per error path
+_PLAYER_ERROR = "An error occurred while retrieving player information."
+_TEAM_ERROR = "An error occured while retrieving team information."
+_SEARCH_ERROR = ("An error occurred while searching for players by team "
+                 "and position.")
+_FORMAT_HELP = ("Please provide both team name and position in format: "
+                "'team_name, position' (e.g., 'Liverpool, Midfielder')")
+
 
 class FootballTools:
+    # Upper bound on memoized tool responses per instance
+    RESPONSE_CACHE_MAXSIZE = 256
+
     def __init__(self, search_service: SearchService, mode: str = "strict"):
         self.search_service = search_service
         self.mode = mode
+        self._tools: Optional[List['Tool']] = None
+        # Finished JSON responses keyed by normalized query; agents repeat
+        # the same player/team lookups often within a session. Kept inline
+        # (not functools.lru_cache) so the tool funcs stay plain bound
+        # methods. Only successful responses are stored.
+        self._player_response_cache: OrderedDict = OrderedDict()
+        self._team_response_cache: OrderedDict = OrderedDict()
+        self._position_response_cache: OrderedDict = OrderedDict()
+        self._response_cache_teams = None
+
+    def _check_cache_generation(self):
+        """Drop rendered responses when the data store refreshes its teams.
+
+        SearchService invalidates its memos per index generation; these
+        caches sit above it and would otherwise keep serving pre-refresh
+        squad data for the process lifetime.
+        """
+        teams = self.search_service.current_teams()
+        if teams is not self._response_cache_teams:
+            self._player_response_cache.clear()
+            self._team_response_cache.clear()
+            self._position_response_cache.clear()
+            self._response_cache_teams = teams
+
+    def _cached_response(self, cache: OrderedDict, key: str) -> Optional[str]:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        return None
+
+    def _store_response(self, cache: OrderedDict, key: str, response: str):
+        cache[key] = response
+        if len(cache) > self.RESPONSE_CACHE_MAXSIZE:
+            cache.popitem(last=False)
 
     def get_player_info(self, player_name: str) -> str:
         try:
+            self._check_cache_generation()
+            cache_key = player_name.strip().lower()
+            cached = self._cached_response(
+                self._player_response_cache, cache_key)
+            if cached is not None:
+                return cached
+
             result = self.search_service.find_player(player_name)
             if not result:
                 return f"No player found matching '{player_name}'."
@@ -36,14 +105,24 @@ class FootballTools:
                 "Nationality": player.nationality
             }
 
-            return json.dumps(player_info, indent=2)
+            response = orjson.dumps(player_info).decode()
+            self._store_response(
+                self._player_response_cache, cache_key, response)
+            return response
 
         except Exception as e:
             logger.error(f"Error retrieving player info: {e}")
-            return "An error occurred while retrieving player information."
+            return _PLAYER_ERROR
 
     def get_team_info(self, team_name: str) -> str:
         try:
+            self._check_cache_generation()
+            cache_key = team_name.strip().lower()
+            cached = self._cached_response(
+                self._team_response_cache, cache_key)
+            if cached is not None:
+                return cached
+
             team = self.search_service.find_team(team_name)
             if not team:
                 return f"No team found matching '{team_name}'"
@@ -55,51 +134,47 @@ class FootballTools:
                 "Founded": team.founded,
                 "Club Colors": team.club_colors,
                 "Venue": team.venue,
-                "Squad": [{
-                    "Name": player.name,
-                    "Position": player.position,
-                    "Date of Birth": player.date_of_birth,
-                    "Age": player.age,
-                    "Nationality": player.nationality
-                } for player in team.squad]
+                "Squad": [dict(zip(_SQUAD_KEYS, _squad_fields(player)))
+                          for player in team.squad]
             }
 
-            return json.dumps(team_info, indent=2)
+            response = orjson.dumps(team_info).decode()
+            self._store_response(
+                self._team_response_cache, cache_key, response)
+            return response
 
         except Exception as e:
             logger.error(f"Error retrieving team info: {e}")
-            return "An error occured while retrieving team information."
+            return _TEAM_ERROR
 
     def find_players_by_team_and_position(self, query: str) -> str:
         """Find players by team and position. Query should be in format: 'team_name, position' or 'team_name - position'."""
 
         try:
             # Parse the query to extract team name and position
-            if ',' in query:
-                parts = [part.strip() for part in query.split(',', 1)]
-            elif ' - ' in query:
-                parts = [part.strip() for part in query.split(' - ', 1)]
-            else:
-                return "Please provide both team name and position in format: 'team_name, position' (e.g., 'Liverpool, Midfielder')"
+            parts = _QUERY_SPLIT.split(query.strip(), maxsplit=1)
 
             if len(parts) != 2:
-                return "Please provide both team name and position in format: 'team_name, position' (e.g., 'Liverpool, Midfielder')"
+                return _FORMAT_HELP
 
             team_name, position = parts
 
+            self._check_cache_generation()
+            # Keyed on the parsed strings as given so the echoed
+            # team/position fields keep the caller's casing
+            cache_key = (team_name, position)
+            cached = self._cached_response(
+                self._position_response_cache, cache_key)
+            if cached is not None:
+                return cached
+
             results = self.search_service.find_players_by_team_and_position(
                 team_name, position)
             if not results:
                 return f"No players found for team '{team_name}' in position '{position}'."
 
-            players_info = []
-            for player in results:
-                players_info.append({
-                    "Name": player.name,
-                    "Nationality": player.nationality,
-                    "Date of Birth": player.date_of_birth,
-                    "Age": player.age
-                })
+            players_info = [dict(zip(_ROSTER_KEYS, _roster_fields(player)))
+                            for player in results]
 
             response = {
                 "team": team_name,
@@ -108,14 +183,27 @@ class FootballTools:
                 "players": players_info
             }
 
-            return json.dumps(response, indent=2)
+            rendered = orjson.dumps(response).decode()
+            self._store_response(
+                self._position_response_cache, cache_key, rendered)
+            return rendered
 
         except Exception as e:
             logger.error(f"Error finding players by team and position: {e}")
-            return f"An error occurred while searching for players by team and position."
+            return _SEARCH_ERROR
 
-    def get_tools(self) -> List[Tool]:
+    def get_tools(self) -> List['Tool']:
         """Get the list of LangChain tools."""
+        # Tool wrappers are immutable for a given instance/mode, so build
+        # them once and hand back the same list on every call.
+        if self._tools is not None:
+            return self._tools
+
+        # Imported here so that merely importing FootballTools (CLI helper
+        # scripts, tests of the plain methods) doesn't pay langchain's
+        # multi-hundred-millisecond package import.
+        from langchain.agents import Tool
+
         tools = [
             Tool(
                 name="Team_Info",
@@ -145,4 +233,5 @@ class FootballTools:
                     "a specific player."
                 ),
             ])
+        self._tools = tools
         return tools